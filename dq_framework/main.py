@@ -1,21 +1,73 @@
+import os
+import time
 import yaml
+import atexit
+import pickle
+import hashlib
 import logging
+import queue
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+from dq_framework.validations import DataValidator
+from dq_framework.reporting.report_generator import ReportGenerator
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Background listener shared by all framework instances in the process
+_log_listener = None
+
+
+def _config_cache_path(config_path: str) -> Path:
+    """Location of the parsed-config cache for a config file, in the user's own cache directory.
+
+    Unpickling runs arbitrary code, so the cache is kept out of the (possibly shared) config
+    directory and only read from a directory owned by the current user.
+    """
+    cache_root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    config_id = hashlib.sha256(os.path.abspath(config_path).encode('utf-8')).hexdigest()[:16]
+    return cache_root / 'dq_framework' / f"config-{config_id}.pkl"
+
 
 class DataQualityFramework:
-    def __init__(self, config_path: str = "../config/rules_dictionary.yaml"):
-        """Initialize the Data Quality Framework."""
+    def __init__(self, config_path: str = "../config/rules_dictionary.yaml", max_workers: Optional[int] = None,
+                 engine: str = 'pandas', skip_unchanged: bool = False, arrow_strings: bool = False):
+        """Initialize the Data Quality Framework.
+
+        engine selects how row-level rules are evaluated: 'pandas' (default) or 'polars'.
+        With skip_unchanged, checks whose columns are unchanged since the previous
+        validate_data call reuse that call's results. arrow_strings converts string object
+        columns to Arrow-backed strings before validating.
+        """
         self.logger = self._setup_logging()
         self.config = self._load_config(config_path)
         self.validation_results = {}
+        self.validator = DataValidator(
+            self.config, max_workers=max_workers, engine=engine, skip_unchanged=skip_unchanged,
+            arrow_strings=arrow_strings
+        )
+
+        # Created on first use; reports are written one at a time on a background thread
+        self._report_generator = None
+        self._report_executor = None
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
+        global _log_listener
+
         logger = logging.getLogger('dq_framework')
         logger.setLevel(logging.INFO)
-        
+
+        # Handlers are installed once per process; later instances share them
+        if _log_listener is not None:
+            return logger
+
         # Create handlers
         c_handler = logging.StreamHandler()
         f_handler = logging.FileHandler('dq_framework.log')
@@ -26,141 +78,102 @@ class DataQualityFramework:
         c_handler.setFormatter(formatter)
         f_handler.setFormatter(formatter)
         
-        # Add handlers to the logger
-        logger.addHandler(c_handler)
-        logger.addHandler(f_handler)
-        
+        # Route records through a queue so console and file I/O happen on a background thread
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, c_handler, f_handler, respect_handler_level=True)
+        _log_listener.start()
+
+        # Flush any queued records before the interpreter exits
+        atexit.register(_log_listener.stop)
+
         return logger
 
     def _load_config(self, config_path: str) -> Dict:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, reusing a pickled parse while the file is unchanged."""
         try:
+            stat = os.stat(config_path)
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            cache_path = _config_cache_path(config_path)
+
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    cached_key, config = pickle.load(cache_file)
+                if cached_key == cache_key:
+                    return config
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                pass
+
             with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+                config = yaml.load(file, Loader=YamlLoader)
+
+            # The cache is an optimisation only; an unwritable cache directory is fine.
+            # Write to a temporary file and rename it so concurrent readers never see a partial cache.
+            temp_path = None
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('wb', dir=cache_path.parent, delete=False) as cache_file:
+                    temp_path = cache_file.name
+                    pickle.dump((cache_key, config), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except OSError as cache_error:
+                self.logger.debug(f"Could not write configuration cache: {str(cache_error)}")
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+            return config
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
             raise
 
-    def validate_data(self, data_source: Any) -> Dict:
+    def validate_data(self, data_source: Any, source_name: str = 'data_source') -> Dict:
         """Run all configured validations on the data source."""
         try:
-            self.logger.info(f"Starting data validation at {datetime.now()}")
-            
-            # Run different types of validations
-            self._run_count_validation(data_source)
-            self._run_checksum_validation(data_source)
-            self._run_business_rules(data_source)
+            started = time.monotonic()
+            self.logger.info(f"Starting data validation of {source_name}")
+
+            # The validator runs the vectorized checks concurrently and stamps the run once
+            self.validation_results = self.validator.validate_dataset(data_source, source_name)
             self._run_reconciliation(data_source)
-            self._run_pattern_checks(data_source)
-            self._run_enumeration_checks(data_source)
-            self._run_mandatory_checks(data_source)
-            self._run_range_checks(data_source)
-            self._run_type_checks(data_source)
-            self._run_unique_checks(data_source)
-            
-            self.logger.info(f"Completed data validation at {datetime.now()}")
+
+            self.logger.info(f"Completed data validation in {time.monotonic() - started:.3f}s")
             return self.validation_results
             
         except Exception as e:
             self.logger.error(f"Error during validation: {str(e)}")
             raise
 
-    def _run_count_validation(self, data_source: Any) -> None:
-        """Run count validation on the data source."""
-        self.logger.info("Running count validation")
-        # Implementation details here
-        self.validation_results['count_validation'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def _run_checksum_validation(self, data_source: Any) -> None:
-        """Run checksum validation on the data source."""
-        self.logger.info("Running checksum validation")
-        # Implementation details here
-        self.validation_results['checksum_validation'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def _run_business_rules(self, data_source: Any) -> None:
-        """Run business rule validations."""
-        self.logger.info("Running business rule validations")
-        # Implementation details here
-        self.validation_results['business_rules'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
     def _run_reconciliation(self, data_source: Any) -> None:
         """Run reconciliation checks."""
         self.logger.info("Running reconciliation checks")
         # Implementation details here
-        self.validation_results['reconciliation'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def _run_pattern_checks(self, data_source: Any) -> None:
-        """Run pattern checks on the data."""
-        self.logger.info("Running pattern checks")
-        # Implementation details here
-        self.validation_results['pattern_checks'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def _run_enumeration_checks(self, data_source: Any) -> None:
-        """Run enumeration checks on the data."""
-        self.logger.info("Running enumeration checks")
-        # Implementation details here
-        self.validation_results['enumeration_checks'] = {
+        self.validation_results['validations']['reconciliation'] = {
             'status': 'completed',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self.validation_results['timestamp']
         }
 
-    def _run_mandatory_checks(self, data_source: Any) -> None:
-        """Run mandatory field checks."""
-        self.logger.info("Running mandatory field checks")
-        # Implementation details here
-        self.validation_results['mandatory_checks'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
-
-    def _run_range_checks(self, data_source: Any) -> None:
-        """Run range checks on numeric fields."""
-        self.logger.info("Running range checks")
-        # Implementation details here
-        self.validation_results['range_checks'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
+    def generate_report(self, output_format: Optional[List[str]] = None) -> Dict[str, str]:
+        """Generate the validation report for the last run; return the written files by format."""
+        return self._write_report(self.validation_results, output_format)
 
-    def _run_type_checks(self, data_source: Any) -> None:
-        """Run data type checks."""
-        self.logger.info("Running type checks")
-        # Implementation details here
-        self.validation_results['type_checks'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
+    def generate_report_async(self, output_format: Optional[List[str]] = None) -> Future:
+        """Write the report for the last run on a background thread.
 
-    def _run_unique_checks(self, data_source: Any) -> None:
-        """Run uniqueness checks."""
-        self.logger.info("Running uniqueness checks")
-        # Implementation details here
-        self.validation_results['unique_checks'] = {
-            'status': 'completed',
-            'timestamp': datetime.now().isoformat()
-        }
+        The returned Future resolves to the written files by format, so the caller can start
+        the next validation while the report is rendered and saved.
+        """
+        if self._report_executor is None:
+            self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dq-report')
+        # Each run produces a new results dict, so the report keeps the one it was asked for
+        return self._report_executor.submit(self._write_report, self.validation_results, output_format)
 
-    def generate_report(self) -> None:
-        """Generate validation report."""
+    def _write_report(self, validation_results: Dict, output_format: Optional[List[str]]) -> Dict[str, str]:
+        """Render and save the report for one set of validation results."""
         try:
             self.logger.info("Generating validation report")
-            # Report generation logic will be implemented in reporting module
-            pass
+            if self._report_generator is None:
+                self._report_generator = ReportGenerator(self.config)
+            return self._report_generator.generate_report(validation_results['validations'], output_format)
         except Exception as e:
             self.logger.error(f"Error generating report: {str(e)}")
             raise
@@ -2,13 +2,12 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List
 from pathlib import Path
-import plotly.graph_objects as go
-import plotly.express as px
-from jinja2 import Environment, FileSystemLoader
-import pandas as pd
-import weasyprint
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# plotly, weasyprint and xlsxwriter are imported inside the methods that use them,
+# so a run only pays the import cost of the report formats it actually produces
 
 class ReportGenerator:
     def __init__(self, config: Dict):
@@ -16,7 +15,18 @@ class ReportGenerator:
         self.config = config
         self.logger = logging.getLogger('dq_framework.reporting')
         self.template_dir = Path(__file__).parent / 'templates'
-        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+
+        # Compiled templates are cached on disk across runs; templates don't change at runtime
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.template_dir)),
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False
+        )
+        self.template = self.env.get_template('report_template.html')
+
+        # All report formats share one output directory, created up front
+        self._reports_dir = Path('reports')
+        self._create_report_directory()
         
     def generate_report(self, validation_results: Dict, output_format: List[str] = None) -> Dict[str, str]:
         """Generate validation report in specified formats."""
@@ -27,16 +37,24 @@ class ReportGenerator:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         try:
-            # Generate report content
-            report_data = self._prepare_report_data(validation_results)
-            
+            formats = [fmt.lower() for fmt in output_format]
+            needs_html = 'html' in formats or 'pdf' in formats
+
+            # Generate report content; charts are only needed by the HTML-based formats
+            report_data = self._prepare_report_data(validation_results, include_visualizations=needs_html)
+
+            # Render the HTML once and share it between the HTML and PDF outputs
+            html_content = None
+            if needs_html:
+                html_content = self.template.render(**report_data)
+
             # Generate reports in specified formats
-            for fmt in output_format:
-                if fmt.lower() == 'html':
-                    report_files['html'] = self._generate_html_report(report_data, timestamp)
-                elif fmt.lower() == 'pdf':
-                    report_files['pdf'] = self._generate_pdf_report(report_data, timestamp)
-                elif fmt.lower() == 'excel':
+            for fmt in formats:
+                if fmt == 'html':
+                    report_files['html'] = self._generate_html_report(html_content, timestamp)
+                elif fmt == 'pdf':
+                    report_files['pdf'] = self._generate_pdf_report(html_content, timestamp)
+                elif fmt == 'excel':
                     report_files['excel'] = self._generate_excel_report(report_data, timestamp)
                     
             return report_files
@@ -45,26 +63,31 @@ class ReportGenerator:
             self.logger.error(f"Error generating report: {str(e)}")
             raise
 
-    def _prepare_report_data(self, validation_results: Dict) -> Dict:
+    def _prepare_report_data(self, validation_results: Dict, include_visualizations: bool = True) -> Dict:
         """Prepare data for report generation."""
+        summary = self._generate_summary(validation_results)
         return {
-            'summary': self._generate_summary(validation_results),
+            'summary': summary,
             'detailed_results': self._prepare_detailed_results(validation_results),
-            'visualizations': self._generate_visualizations(validation_results),
+            'visualizations': (
+                self._generate_visualizations(validation_results, summary) if include_visualizations else {}
+            ),
             'timestamp': datetime.now().isoformat(),
             'branding': self.config['reporting']['branding']
         }
 
     def _generate_summary(self, validation_results: Dict) -> Dict:
         """Generate executive summary of validation results."""
-        total_validations = len(validation_results)
-        passed_validations = sum(1 for result in validation_results.values() 
-                               if result.get('status') == 'completed')
+        statuses = [result.get('status') for result in validation_results.values()]
+        total_validations = len(statuses)
+        passed_validations = statuses.count('completed')
+        skipped_validations = statuses.count('skipped')
         
         return {
             'total_validations': total_validations,
             'passed_validations': passed_validations,
-            'failed_validations': total_validations - passed_validations,
+            'failed_validations': total_validations - passed_validations - skipped_validations,
+            'skipped_validations': skipped_validations,
             'success_rate': (passed_validations / total_validations * 100) if total_validations > 0 else 0
         }
 
@@ -83,15 +106,12 @@ class ReportGenerator:
             
         return detailed_results
 
-    def _generate_visualizations(self, validation_results: Dict) -> Dict:
+    def _generate_visualizations(self, validation_results: Dict, summary: Dict) -> Dict:
         """Generate visualization data for the report."""
-        # Create validation status pie chart
-        status_counts = {'Passed': 0, 'Failed': 0}
-        for result in validation_results.values():
-            if result.get('status') == 'completed':
-                status_counts['Passed'] += 1
-            else:
-                status_counts['Failed'] += 1
+        import plotly.graph_objects as go
+
+        # Create validation status pie chart from the already computed summary
+        status_counts = {'Passed': summary['passed_validations'], 'Failed': summary['failed_validations']}
 
         status_pie = go.Figure(data=[go.Pie(
             labels=list(status_counts.keys()),
@@ -109,51 +129,75 @@ class ReportGenerator:
             y=list(validation_types.values())
         )])
         
+        # Only the first chart needs to pull in plotly.js when falling back to HTML output
         return {
-            'status_pie': status_pie.to_html(full_html=False),
-            'type_bar': type_bar.to_html(full_html=False)
+            'status_pie': self._render_figure(status_pie, include_plotlyjs='cdn'),
+            'type_bar': self._render_figure(type_bar, include_plotlyjs=False)
         }
 
-    def _generate_html_report(self, report_data: Dict, timestamp: str) -> str:
-        """Generate HTML report."""
-        template = self.env.get_template('report_template.html')
-        output_path = f'reports/validation_report_{timestamp}.html'
-        
-        # Ensure reports directory exists
-        os.makedirs('reports', exist_ok=True)
+    def _render_figure(self, figure: Any, include_plotlyjs) -> str:
+        """Render a figure as inline SVG, or as a CDN-backed plotly.js div when kaleido is unavailable."""
+        import plotly.io as pio
+
+        try:
+            return pio.to_image(figure, format='svg').decode('utf-8')
+        except (ImportError, ValueError) as e:
+            self.logger.debug(f"Static chart export unavailable, embedding plotly.js chart: {str(e)}")
+            return figure.to_html(full_html=False, include_plotlyjs=include_plotlyjs)
+
+    def _generate_html_report(self, html_content: str, timestamp: str) -> str:
+        """Generate HTML report from the rendered template."""
+        output_path = str(self._reports_dir / f'validation_report_{timestamp}.html')
         
         # Generate HTML report
-        html_content = template.render(**report_data)
         with open(output_path, 'w') as f:
             f.write(html_content)
             
         return output_path
 
-    def _generate_pdf_report(self, report_data: Dict, timestamp: str) -> str:
-        """Generate PDF report."""
-        html_path = self._generate_html_report(report_data, timestamp)
-        pdf_path = f'reports/validation_report_{timestamp}.pdf'
-        
-        # Convert HTML to PDF
-        weasyprint.HTML(filename=html_path).write_pdf(pdf_path)
+    def _generate_pdf_report(self, html_content: str, timestamp: str) -> str:
+        """Generate PDF report from the rendered template."""
+        import weasyprint
+
+        pdf_path = str(self._reports_dir / f'validation_report_{timestamp}.pdf')
+
+        # Convert HTML to PDF; base_url keeps relative asset paths resolvable
+        weasyprint.HTML(string=html_content, base_url=str(self.template_dir)).write_pdf(pdf_path)
         return pdf_path
 
     def _generate_excel_report(self, report_data: Dict, timestamp: str) -> str:
         """Generate Excel report with multiple sheets."""
-        excel_path = f'reports/validation_report_{timestamp}.xlsx'
-        
-        # Create Excel writer
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+        import xlsxwriter
+
+        excel_path = str(self._reports_dir / f'validation_report_{timestamp}.xlsx')
+
+        # constant_memory makes xlsxwriter flush each row to disk once the next row starts
+        workbook = xlsxwriter.Workbook(excel_path, {'constant_memory': True})
+        try:
             # Summary sheet
-            summary_df = pd.DataFrame([report_data['summary']])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
+            self._write_excel_sheet(workbook, 'Summary', [report_data['summary']])
+
             # Detailed results sheet
-            detailed_df = pd.DataFrame(report_data['detailed_results'])
-            detailed_df.to_excel(writer, sheet_name='Detailed Results', index=False)
-            
+            self._write_excel_sheet(workbook, 'Detailed Results', report_data['detailed_results'])
+        finally:
+            workbook.close()
+
         return excel_path
 
+    def _write_excel_sheet(self, workbook: Any, sheet_name: str, rows: List[Dict]) -> None:
+        """Stream a list of records into a new worksheet, header row first."""
+        worksheet = workbook.add_worksheet(sheet_name)
+        columns = list(rows[0]) if rows else []
+        worksheet.write_row(0, 0, columns)
+
+        for row_number, row in enumerate(rows, start=1):
+            # Nested details and samples are written as JSON text
+            values = [
+                json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+                for value in (row.get(column) for column in columns)
+            ]
+            worksheet.write_row(row_number, 0, values)
+
     def _get_error_samples(self, result: Dict, max_samples: int = 5) -> List[Dict]:
         """Get sample of error records from validation result."""
         error_samples = result.get('error_samples', [])
@@ -166,4 +210,4 @@ class ReportGenerator:
 
     def _create_report_directory(self) -> None:
         """Create reports directory if it doesn't exist."""
-        os.makedirs('reports', exist_ok=True)
+        os.makedirs(self._reports_dir, exist_ok=True)
@@ -1,40 +1,689 @@
+import os
+import ast
+import functools
+import hashlib
+import importlib.util
+import io
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import operator
+import re
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import pandas as pd
-import great_expectations as ge
-from great_expectations.dataset import PandasDataset
+import numpy as np
+
+# FireDucks is an opt-in, pandas-compatible backend that compiles and fuses frame operations;
+# select it with DQ_FRAMEWORK_BACKEND=fireducks, otherwise (or if it isn't installed) use pandas
+_BACKEND = 'pandas'
+if os.environ.get('DQ_FRAMEWORK_BACKEND', '').lower() == 'fireducks':
+    try:
+        import fireducks.pandas as pd
+        _BACKEND = 'fireducks'
+    except ImportError:
+        import pandas as pd
+else:
+    import pandas as pd
+
+# pyarrow is optional; when installed, string columns are validated with Arrow compute kernels
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# numexpr is optional; pandas falls back to evaluating rule expressions with plain NumPy
+try:
+    import numexpr  # noqa: F401
+    _EVAL_ENGINE = 'numexpr'
+except ImportError:
+    _EVAL_ENGINE = 'python'
+
+# Candidate column names in a business rule expression
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Pattern syntax RE2 reads differently from Python re: Unicode-aware classes and word
+# boundaries, POSIX bracket classes and inline flags
+_RE2_DIVERGENT = re.compile(r'\\[wWdDsSbB]|\[:|\(\?[aiLmsux-]')
+
+# The accelerators below are optional and only imported on first use, so a default run on a
+# small frame doesn't pay their import cost; find_spec checks availability without importing
+
+# hyperscan compiles a pattern to an automaton that scans a whole column in one call
+_HAS_HYPERSCAN = importlib.util.find_spec('hyperscan') is not None
+
+# Below this many rows, regular regex matching is cheaper than building the scan buffer
+_HYPERSCAN_MIN_ROWS = 100_000
+
+# numba compiles the range comparison into a parallel machine-code loop
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+# Below this many rows, thread start-up outweighs the parallel range kernel
+_NUMBA_MIN_ROWS = 100_000
+
+# Range rules are evaluated over row tiles of this size so each tile stays in cache across rules
+_RANGE_CHUNK_ROWS = 8192
+
+# with engine='polars' the row-level rules run as one fused lazy query
+_HAS_POLARS = importlib.util.find_spec('polars') is not None
+
+ENGINES = ('pandas', 'polars')
+
+# xxhash fingerprints columns; without it fingerprints fall back to an 8-byte BLAKE2b digest
+_HAS_XXHASH = importlib.util.find_spec('xxhash') is not None
+
+# Map configured type names to pandas dtypes
+TYPE_MAPPING = {
+    'string': np.dtype('object'),
+    'integer': np.dtype('int64'),
+    'float': np.dtype('float64'),
+    'boolean': np.dtype('bool'),
+    'date': np.dtype('datetime64[ns]')
+}
+
+
+def _resolve_type_name(type_name: str) -> Any:
+    """Map a configured type name to a dtype; names pandas doesn't know are kept as given."""
+    if type_name.lower() in TYPE_MAPPING:
+        return TYPE_MAPPING[type_name.lower()]
+    try:
+        return pd.api.types.pandas_dtype(type_name)
+    except TypeError:
+        # Reported as a mismatch by the type check rather than failing construction
+        return type_name
+
+
+def _parse_range_rule(field: Dict) -> Tuple[str, float, float, bool]:
+    """Resolve a template field's range into (column, bottom, top, inclusive)."""
+    range_config = field['range']
+    return (
+        field['column_name'],
+        float(range_config['bottom']),
+        float(range_config['top']),
+        range_config.get('scope') == 'inclusive'
+    )
+
+
+def _sample_positions(mask: Any, limit: int = 5) -> np.ndarray:
+    """Return the row positions of the first few True entries without copying the matching rows."""
+    return np.flatnonzero(np.asarray(mask, dtype=bool))[:limit]
+
+
+def _is_arrow_string(dtype: Any) -> bool:
+    """Whether a column dtype stores strings in an Arrow buffer."""
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == 'pyarrow'
+    return isinstance(dtype, pd.ArrowDtype) and (
+        pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    )
+
+
+def _matches_type(actual_type: Any, expected_type: Any) -> bool:
+    """Compare a column dtype with the configured one, looking through Arrow-backed storage."""
+    if isinstance(expected_type, str):
+        # An unresolved type name matches nothing
+        return False
+    if actual_type == expected_type:
+        return True
+    # Arrow-backed and pandas string columns still satisfy a 'string' (object) expectation
+    if expected_type == TYPE_MAPPING['string']:
+        return isinstance(actual_type, pd.StringDtype) or _is_arrow_string(actual_type)
+    return isinstance(actual_type, pd.ArrowDtype) and actual_type.numpy_dtype == expected_type
+
+
+def _eval_operand(values: pd.Series) -> pd.Series:
+    """Hand numexpr a NumPy-backed column where a nullable or Arrow one holds plain numbers.
+
+    Nulls become NaN, so a comparison against a null is False before negation exactly as it
+    is for float columns and in the polars engine.
+    """
+    if not isinstance(values.dtype, pd.api.extensions.ExtensionDtype) or values.dtype.kind not in 'iuf':
+        return values
+    if values.dtype.kind in 'iu' and not values.hasnans:
+        return values.astype(values.dtype.numpy_dtype)
+    return pd.Series(values.to_numpy(dtype=np.float64, na_value=np.nan), index=values.index, name=values.name)
+
+
+def _column_fingerprint(values: pd.Series) -> int:
+    """Hash a column's dtype, length and raw storage into a 64-bit fingerprint."""
+    if _HAS_XXHASH:
+        import xxhash
+        digest = xxhash.xxh3_64()
+    else:
+        digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{values.dtype}:{len(values)}".encode())
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        digest.update(np.ascontiguousarray(values.to_numpy(copy=False)).view(np.uint8))
+    elif isinstance(values.dtype, pd.ArrowDtype) or _is_arrow_string(values.dtype):
+        # Hash the Arrow buffers as they are; slices also record where they start
+        arrow = pa.array(values.array)
+        for chunk in arrow.chunks if isinstance(arrow, pa.ChunkedArray) else [arrow]:
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    else:
+        # Object and categorical columns hash through pandas' vectorized per-value hashes, which
+        # stringify non-str values; hash the value types too so 1 and '1' stay distinct
+        digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().view(np.uint8))
+        inferred = pd.api.types.infer_dtype(values, skipna=False)
+        digest.update(inferred.encode())
+        if inferred not in ('string', 'empty'):
+            kinds = pd.Series(values.to_numpy(dtype=object)).map(lambda value: f"{type(value).__module__}.{type(value).__qualname__}")
+            digest.update(pd.util.hash_array(kinds.to_numpy()).view(np.uint8))
+    return int.from_bytes(digest.digest(), 'little')
+
+
+@functools.lru_cache(maxsize=None)
+def _range_kernel() -> Callable:
+    """Import numba and compile the parallel range kernel the first time a large column needs it."""
+    import numba
+
+    @numba.njit(parallel=True, cache=True)
+    def range_kernel(array, bottom, top, inclusive):
+        """Flag values outside the bounds in a single parallel pass; NaN never compares out of range."""
+        out_of_range = np.empty(array.shape[0], dtype=np.bool_)
+        for position in numba.prange(array.shape[0]):
+            value = array[position]
+            if inclusive:
+                out_of_range[position] = value < bottom or value > top
+            else:
+                out_of_range[position] = value <= bottom or value >= top
+        return out_of_range
+
+    return range_kernel
+
+
+def _range_array(values: pd.Series) -> np.ndarray:
+    """Return the column as a NumPy array for bound comparisons, without copying where possible."""
+    if isinstance(values.dtype, np.dtype) and not values.hasnans:
+        return values.to_numpy(copy=False)
+    # Nullable and Arrow-backed columns compare as float with NaN for missing values
+    return values.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _compile_range_rules(range_rules: List[Tuple[str, float, float, bool]], positions: List[int]) -> Callable:
+    """Generate one function that applies every range rule to a row tile.
+
+    The bounds, comparison operators and violation-matrix columns are written into the source
+    as constants, so a tile costs one call with no per-rule lookups. The function takes the
+    rule arrays in rule order (None to skip a rule), the violation matrix and a row slice,
+    and writes a mask of values outside the bounds; NaN is never out of range.
+    """
+    lines = ['def _mark_out_of_range(arrays, violations, rows):']
+    for index, ((_, bottom, top, inclusive), position) in enumerate(zip(range_rules, positions)):
+        below, above = ('less', 'greater') if inclusive else ('less_equal', 'greater_equal')
+        lines += [
+            f'    array = arrays[{index}]',
+            '    if array is not None:',
+            '        tile = array[rows]',
+            f'        out = violations[rows, {position}]',
+            f'        np.{below}(tile, {bottom!r}, out=out)',
+            f'        out |= np.{above}(tile, {top!r})',
+        ]
+    lines.append('    return None')
+
+    namespace = {'np': np, 'inf': np.inf, 'nan': np.nan}
+    exec(compile('\n'.join(lines) + '\n', '<dq_framework range rules>', 'exec'), namespace)
+    return namespace['_mark_out_of_range']
+
+
+def _compile_hyperscan(pattern: re.Pattern) -> Optional[Any]:
+    """Compile a pattern into a line-oriented Hyperscan database, or None if it can't be used.
+
+    Only patterns anchored with ^ and $ are compiled: their matches end at line ends, so the scan
+    calls back at most about once per row instead of at every character of a long match.
+    """
+    source = pattern.pattern
+    if not _HAS_HYPERSCAN or not (source.startswith('^') and source.endswith('$') and not source.endswith('\\$')):
+        return None
+    import hyperscan
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[source.encode('utf-8')],
+            ids=[0],
+            elements=1,
+            # UCP gives \w, \d and \s Unicode meaning, as in Python's re;
+            # SOM_LEFTMOST reports where each match starts, so matches spanning rows can be told apart
+            flags=[
+                hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                | hyperscan.HS_FLAG_SOM_LEFTMOST
+            ]
+        )
+        return database
+    except hyperscan.error:
+        # Patterns using constructs Hyperscan doesn't support stay on the re engine
+        return None
+
+
+def _hyperscan_contains(values: pd.Series, present: np.ndarray, database: Any,
+                        pattern: re.Pattern) -> Optional[np.ndarray]:
+    """Match all present values in one Hyperscan scan; None when the column can't be scanned as lines."""
+    # Join the values into one newline-terminated buffer and locate where each row ends
+    text = values[present].astype(str).tolist()
+    buffer = ('\n'.join(text) + '\n').encode('utf-8')
+    line_ends = np.flatnonzero(np.frombuffer(buffer, dtype=np.uint8) == ord('\n'))
+    if len(line_ends) != len(text):
+        # A value contains a newline itself, so rows can't be told apart by line
+        return None
+
+    match_starts = []
+    match_ends = []
+
+    def on_match(_id, start, end, _flags, _context):
+        match_starts.append(start)
+        match_ends.append(end)
+
+    database.scan(buffer, match_event_handler=on_match)
+
+    # Row of each match's start and end; a match is only a row's match if both lie in that row
+    start_rows = np.searchsorted(line_ends, np.asarray(match_starts, dtype=np.int64), side='left')
+    end_rows = np.searchsorted(line_ends, np.asarray(match_ends, dtype=np.int64), side='left')
+    in_bounds = end_rows < len(text)
+    within_row = in_bounds & (start_rows == end_rows)
+
+    row_matched = np.zeros(len(text), dtype=bool)
+    row_matched[end_rows[within_row]] = True
+
+    # Negated classes and \s can consume the separator, and Hyperscan reports only the leftmost
+    # start per end offset, so a match spanning rows may hide one inside the row where it ends;
+    # those few rows are settled with re
+    uncertain = np.unique(end_rows[in_bounds & ~within_row])
+    for row in uncertain[~row_matched[uncertain]]:
+        row_matched[row] = pattern.search(text[row]) is not None
+
+    matched = np.zeros(len(values), dtype=bool)
+    matched[np.flatnonzero(present)[row_matched]] = True
+    return matched
+
+
+def _business_rule_expression(rule: Dict) -> str:
+    """Build the expression that is True for rows violating a business rule."""
+    if 'expression' in rule:
+        # Single-expression rules hold for every row
+        return f"~({rule['expression']})"
+    # Conditional rules must pass the validation wherever the condition applies
+    return f"({rule['condition']}) & ~({rule['validation']})"
+
+
+_POLARS_BINARY_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+}
+_POLARS_COMPARISONS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+
+
+def _parse_eval_expression(expression: str) -> ast.Expression:
+    """Parse a rule the way pandas.eval does.
+
+    pandas.eval rewrites & and | to 'and' and 'or' before parsing, so they bind looser than
+    comparisons: 'a > 2 & b < 3' means '(a > 2) and (b < 3)', not 'a > (2 & b) < 3'.
+    """
+    tokens = []
+    for token in tokenize.generate_tokens(io.StringIO(expression).readline):
+        kind, value = token[:2]
+        if kind == tokenize.OP and value in ('&', '|'):
+            kind, value = tokenize.NAME, 'and' if value == '&' else 'or'
+        tokens.append((kind, value))
+    return ast.parse(tokenize.untokenize(tokens).strip(), mode='eval')
+
+
+def _polars_expression(node: ast.AST) -> Any:
+    """Translate a parsed business rule expression into a polars expression.
+
+    Covers the subset pandas.eval rules use in practice: column names, literals, arithmetic,
+    comparisons, membership tests and boolean logic. Raises ValueError for anything else.
+    Each comparison treats a null operand as False, as NumPy does for NaN, before any negation.
+    """
+    import polars as pl
+    if isinstance(node, ast.Expression):
+        return _polars_expression(node.body)
+    if isinstance(node, ast.Name):
+        return pl.col(node.id)
+    if isinstance(node, ast.Constant):
+        return pl.lit(node.value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _POLARS_BINARY_OPERATORS:
+        return _POLARS_BINARY_OPERATORS[type(node.op)](_polars_expression(node.left), _polars_expression(node.right))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Invert, ast.Not)):
+        return ~_polars_expression(node.operand)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_polars_expression(node.operand)
+    if isinstance(node, ast.BoolOp):
+        combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        expression = _polars_expression(node.values[0])
+        for value in node.values[1:]:
+            expression = combine(expression, _polars_expression(value))
+        return expression
+    if isinstance(node, ast.Compare):
+        expression = None
+        left = node.left
+        for comparison, right in zip(node.ops, node.comparators):
+            if isinstance(comparison, (ast.In, ast.NotIn)):
+                if not isinstance(right, (ast.Tuple, ast.List)):
+                    raise ValueError("membership tests need a literal list of values")
+                values = [ast.literal_eval(element) for element in right.elts]
+                term = _polars_expression(left).is_in(values).fill_null(False)
+                if isinstance(comparison, ast.NotIn):
+                    term = ~term
+            elif type(comparison) in _POLARS_COMPARISONS:
+                term = _POLARS_COMPARISONS[type(comparison)](
+                    _polars_expression(left), _polars_expression(right)
+                ).fill_null(False)
+            else:
+                raise ValueError(f"unsupported comparison {type(comparison).__name__}")
+            expression = term if expression is None else expression & term
+            left = right
+        return expression
+    raise ValueError(f"unsupported syntax {type(node).__name__}")
+
+
+def _summarize_unexpected(values: pd.Series, unexpected: np.ndarray) -> Tuple[bool, int, List]:
+    """Reduce a violation mask to (success, unexpected count, samples)."""
+    unexpected_count = int(unexpected.sum())
+    samples = values.iloc[_sample_positions(unexpected)].tolist() if unexpected_count else []
+    return unexpected_count == 0, unexpected_count, samples
+
+
+def _re2_equivalent(pattern: re.Pattern) -> bool:
+    """Whether RE2, Arrow's regex engine, is known to match exactly what Python re does.
+
+    Checked conservatively on the source: RE2's \\w, \\d, \\s and \\b are ASCII-only where
+    re's are Unicode-aware, and flags set on the compiled pattern would not reach RE2.
+    """
+    return (
+        pattern.pattern.isascii()
+        and not pattern.flags & ~re.UNICODE
+        and _RE2_DIVERGENT.search(pattern.pattern) is None
+    )
+
+
+def _unmatched_mask(values: pd.Series, pattern: re.Pattern, database: Any = None) -> np.ndarray:
+    """Flag non-null values that do not match a compiled pattern."""
+    present = values.notna().to_numpy()
+    matched = None
+    if database is not None and len(values) >= _HYPERSCAN_MIN_ROWS:
+        matched = _hyperscan_contains(values, present, database, pattern)
+
+    if matched is None and _is_arrow_string(values.dtype) and _re2_equivalent(pattern):
+        # Match the Arrow buffer directly; pa.array adopts the column without copying
+        arrow = pa.array(values.array)
+        # Python's $ also matches before a trailing newline, RE2's only at the very end
+        if '$' not in pattern.pattern or not pc.any(pc.match_substring(arrow, '\n')).as_py():
+            try:
+                matched = pc.fill_null(pc.match_substring_regex(arrow, pattern.pattern), False)
+                matched = matched.to_numpy(zero_copy_only=False)
+            except pa.ArrowInvalid:
+                # RE2 rejects some valid Python patterns (lookarounds, backreferences); use re for those
+                pass
+
+    if matched is None:
+        if _is_arrow_string(values.dtype):
+            matched = values.astype(object).str.contains(pattern).to_numpy(dtype=bool, na_value=False)
+        elif isinstance(values.dtype, pd.StringDtype):
+            matched = values.str.contains(pattern.pattern).to_numpy(dtype=bool, na_value=False)
+        else:
+            matched = values.astype(str).str.contains(pattern).to_numpy()
+
+    # Missing values are not pattern violations; the mandatory check reports them
+    return present & ~matched
+
+
+def _outside_set_mask(values: pd.Series, allowed_values: pd.Index) -> np.ndarray:
+    """Flag non-null values that are not in an allowed set."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Already dictionary-encoded: test each category once, then gather per row by code.
+        # The trailing True is what code -1 (missing) picks up, so nulls never count.
+        valid_codes = np.append(values.cat.categories.isin(allowed_values), True)
+        return ~valid_codes[values.cat.codes.to_numpy()]
+    # Encoding against the allowed categories leaves code -1 for every value outside the set
+    codes = pd.Categorical(values, categories=allowed_values).codes
+    return (codes == -1) & values.notna().to_numpy()
+
 
 class DataValidator:
-    def __init__(self, config: Dict):
-        """Initialize the Data Validator."""
+    def __init__(self, config: Dict, max_workers: Optional[int] = None, engine: str = 'pandas',
+                 skip_unchanged: bool = False, arrow_strings: bool = False):
+        """Initialize the Data Validator.
+
+        engine='polars' computes the range, enumeration and business rule masks in a single
+        polars query; the remaining checks and all reporting stay on pandas.
+
+        skip_unchanged fingerprints the columns on every run and reuses the previous result
+        of any check whose columns have not changed since the last run.
+
+        arrow_strings converts all-string object columns to Arrow-backed strings before the
+        checks run. It is off by default: on object columns the checks are usually as fast,
+        and pattern checks keep Python re semantics without an RE2 round trip.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+        if engine == 'polars' and not _HAS_POLARS:
+            raise ImportError("engine='polars' requires the polars package")
+
         self.config = config
+        self.engine = engine
         self.logger = logging.getLogger('dq_framework.validations')
         self.validation_results = {}
+        self.max_workers = max_workers or os.cpu_count()
+        self.arrow_strings = arrow_strings
+
+        # Validations are independent and read-only on the dataset, so they can run concurrently
+        self._checks = [
+            ('count_validation', self._run_count_validation),
+            ('checksum_validation', self._run_checksum_validation),
+            ('duplicate_check', self._run_duplicate_check),
+            ('pattern_check', self._run_pattern_check),
+            ('enumeration_check', self._run_enumeration_check),
+            ('mandatory_check', self._run_mandatory_check),
+            ('range_check', self._run_range_check),
+            ('type_check', self._run_type_check),
+            ('unique_check', self._run_unique_check),
+            ('business_rules', self._run_business_rules),
+        ]
+
+        # Resolve the rule dictionary once so the checks don't walk the YAML tree on every run
+        template = config.get('template', [])
+        self._mandatory_fields = [field['column_name'] for field in template if field.get('mandatory', False)]
+        self._unique_fields = [field['column_name'] for field in template if field.get('unique', False)]
+        # Rules with missing or non-numeric bounds are reported by the range check, not here
+        self._range_rules = []
+        self._range_rule_errors = {}
+        for field in template:
+            if 'range' in field:
+                try:
+                    self._range_rules.append(_parse_range_rule(field))
+                except (KeyError, TypeError, ValueError) as rule_error:
+                    self._range_rule_errors[field['column_name']] = f"invalid range bounds: {rule_error!r}"
+        self._expected_count = config.get('expected_count', 0)
+        self._checksum_columns = config.get('checksum_columns', [])
+        self._duplicate_check_columns = config.get('duplicate_check_columns')
+        self._expected_types = {
+            field['column_name']: _resolve_type_name(field['type_name'])
+            for field in template if 'type_name' in field
+        }
+        self._compiled_patterns = {
+            column: re.compile(pattern) for column, pattern in config.get('pattern', {}).items()
+        }
+        # Hyperscan databases are compiled the first time a column is large enough to use one
+        self._hyperscan_databases = {}
+        self._enumerations = {
+            column: pd.Index(allowed_values).unique() for column, allowed_values in config.get('enumerations', {}).items()
+        }
+
+        self._business_rule_expressions = {
+            rule['rule_id']: _business_rule_expression(rule)
+            for rule in config.get('business_rules', [])
+        }
+        # All rules are evaluated by one multi-line eval, each assigned to a positional name
+        self._business_rule_program = '\n'.join(
+            f"_rule_{position} = {expression}"
+            for position, expression in enumerate(self._business_rule_expressions.values())
+        )
+        # Names the rules may reference, so evaluation only binds the columns it needs
+        self._business_rule_names = frozenset(
+            name for expression in self._business_rule_expressions.values()
+            for name in _IDENTIFIER.findall(expression)
+        )
 
-    def validate_dataset(self, data: pd.DataFrame, source_name: str) -> Dict:
-        """Run all configured validations on the dataset."""
+        # Row-level rules, one column each in the violation matrix, keyed by (validation type, column or rule id)
+        self._row_rules = (
+            [('duplicate_check', 'row')]
+            + [('pattern_check', column) for column in self._compiled_patterns]
+            + [('enumeration_check', column) for column in self._enumerations]
+            + [('mandatory_check', column) for column in self._mandatory_fields]
+            + [('range_check', column) for column, _, _, _ in self._range_rules]
+            + [('unique_check', column) for column in self._unique_fields]
+            + [('business_rules', rule_id) for rule_id in self._business_rule_expressions]
+        )
+        self._row_rule_index = {key: position for position, key in enumerate(self._row_rules)}
+        self._mark_out_of_range = _compile_range_rules(
+            self._range_rules,
+            [self._row_rule_index[('range_check', column)] for column, _, _, _ in self._range_rules]
+        )
+        self._violations = np.zeros((0, len(self._row_rules)), dtype=bool, order='F')
+
+        # Row masks from the polars query, keyed like the row rules
+        self._violation_masks = {}
+
+        # Columns each check's result depends on; None means every column of the dataset.
+        # Duplicate and business rule samples are whole rows, so those depend on every column.
+        self._check_columns = {
+            'count_validation': [],
+            'checksum_validation': self._checksum_columns,
+            'duplicate_check': None,
+            'pattern_check': list(self._compiled_patterns),
+            'enumeration_check': list(self._enumerations),
+            'mandatory_check': self._mandatory_fields,
+            'range_check': [column for column, _, _, _ in self._range_rules],
+            'type_check': list(self._expected_types),
+            'unique_check': self._unique_fields,
+            'business_rules': None,
+        }
+        self.skip_unchanged = skip_unchanged
+        # Previous run's check signatures, results and violation matrix, for skip_unchanged
+        self._last_signatures = {}
+        self._last_validations = {}
+        self._last_violations = None
+        self._polars_rules = self._build_polars_rules() if engine == 'polars' else []
+
+    def _build_polars_rules(self) -> List[Tuple[Tuple[str, str], Any]]:
+        """Express every row-level rule as a polars expression that is True for violating rows."""
+        import polars as pl
+        rules = []
+        for column, bottom, top, inclusive in self._range_rules:
+            within = pl.col(column).is_between(bottom, top, closed='both' if inclusive else 'none')
+            rules.append((('range_check', column), ~within))
+        for column, allowed_values in self._enumerations.items():
+            rules.append((
+                ('enumeration_check', column),
+                pl.col(column).is_not_null() & ~pl.col(column).is_in(allowed_values.tolist())
+            ))
+        for rule_id, expression in self._business_rule_expressions.items():
+            try:
+                rules.append((('business_rules', rule_id), _polars_expression(_parse_eval_expression(expression))))
+            except (SyntaxError, ValueError) as translate_error:
+                # Left to pandas.eval, which also reports the error if the rule is invalid
+                self.logger.debug(f"Business rule {rule_id} stays on pandas: {str(translate_error)}")
+        return rules
+
+    def _polars_violation_masks(self, data: pd.DataFrame) -> Dict[Tuple[str, str], np.ndarray]:
+        """Evaluate all polars rules over the dataset in one lazy query."""
+        import polars as pl
+        rules = [
+            (key, expression) for key, expression in self._polars_rules
+            if set(expression.meta.root_names()) <= set(data.columns)
+        ]
+        if not rules:
+            return {}
+
+        columns = sorted({name for _, expression in rules for name in expression.meta.root_names()})
         try:
-            # Convert to Great Expectations dataset
-            ge_dataset = ge.from_pandas(data)
-            
+            frame = pl.from_pandas(data[columns]).lazy()
+        except Exception as convert_error:
+            self.logger.debug(f"polars engine falling back to pandas: {str(convert_error)}")
+            return {}
+
+        # Nulls never count as violations, matching the pandas checks
+        selections = [
+            expression.fill_null(False).alias(f"_mask_{position}")
+            for position, (_, expression) in enumerate(rules)
+        ]
+        try:
+            masks = frame.select(selections).collect()
+            return {key: masks[f"_mask_{position}"].to_numpy() for position, (key, _) in enumerate(rules)}
+        except Exception:
+            pass
+
+        # A rule doesn't fit the data (e.g. a type mismatch); run them one by one and leave
+        # the failing ones to the pandas checks, which report them per check
+        violation_masks = {}
+        for (key, _), selection in zip(rules, selections):
+            try:
+                violation_masks[key] = frame.select(selection).collect().to_series().to_numpy()
+            except Exception as rule_error:
+                self.logger.debug(f"{key[0]} rule {key[1]} stays on pandas: {str(rule_error)}")
+        return violation_masks
+
+    def validate_dataset(self, data: pd.DataFrame, source_name: str, fast_fail: bool = False) -> Dict:
+        """Run all configured validations on the dataset.
+
+        With fast_fail, checks run in order and stop at the first one that does not pass;
+        the remaining checks are reported as skipped.
+        """
+        try:
+            if _BACKEND == 'fireducks' and not isinstance(data, pd.DataFrame):
+                # Frames built with stock pandas are handed over to the FireDucks backend once
+                data = pd.from_pandas(data)
+            data = self._with_arrow_strings(data)
+
             self.validation_results = {
                 'source_name': source_name,
                 'timestamp': datetime.now().isoformat(),
                 'validations': {}
             }
 
-            # Run all configured validations
-            self._run_count_validation(ge_dataset)
-            self._run_checksum_validation(ge_dataset)
-            self._run_duplicate_check(ge_dataset)
-            self._run_pattern_check(ge_dataset)
-            self._run_enumeration_check(ge_dataset)
-            self._run_mandatory_check(ge_dataset)
-            self._run_range_check(ge_dataset)
-            self._run_type_check(ge_dataset)
-            self._run_unique_check(ge_dataset)
-            self._run_business_rules(ge_dataset)
+            # Each check writes its masks into its own columns; Fortran order keeps every column contiguous
+            self._violations = np.zeros((len(data), len(self._row_rules)), dtype=bool, order='F')
+            self._violation_masks = self._polars_violation_masks(data) if self._polars_rules else {}
+
+            signatures = self._check_signatures(data) if self.skip_unchanged else {}
+            self._reuse_unchanged_results(signatures)
+            pending = [
+                (validation_type, check) for validation_type, check in self._checks
+                if validation_type not in self.validation_results['validations']
+            ]
+
+            workers = min(self.max_workers, len(pending))
+            if fast_fail:
+                self._run_checks_until_failure(data)
+            elif workers <= 1:
+                for _, check in pending:
+                    check(data)
+            else:
+                # Run all configured validations; each one writes to its own results key.
+                # The checks spend their time in NumPy/pandas/regex C code, which releases the GIL.
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(check, data) for _, check in pending]
+                    for future in futures:
+                        future.result()
+
+            # Checks finish in any order; report them in the configured order
+            validations = self.validation_results['validations']
+            self.validation_results['validations'] = {
+                validation_type: validations[validation_type]
+                for validation_type, _ in self._checks
+                if validation_type in validations
+            }
+            self.validation_results['failed_row_count'] = int(self._violations.any(axis=1).sum())
+
+            if self.skip_unchanged:
+                self._last_signatures = signatures
+                self._last_validations = self.validation_results['validations']
+                self._last_violations = self._violations
 
             return self.validation_results
 
@@ -42,14 +691,78 @@ class DataValidator:
             self.logger.error(f"Error validating dataset: {str(e)}")
             raise
 
-    def _run_count_validation(self, dataset: PandasDataset) -> None:
+    def _run_checks_until_failure(self, data: pd.DataFrame) -> None:
+        """Run checks sequentially, skipping everything after the first check that does not pass."""
+        validations = self.validation_results['validations']
+        failed = False
+        for validation_type, check in self._checks:
+            if failed:
+                validations[validation_type] = {'status': 'skipped'}
+                continue
+            # Results reused from the previous run still decide whether to stop
+            if validation_type not in validations:
+                check(data)
+            failed = validations[validation_type]['status'] != 'completed'
+
+    def _check_signatures(self, data: pd.DataFrame) -> Dict[str, Tuple]:
+        """Fingerprint the columns each check reads, so unchanged inputs can be recognised."""
+        fingerprints = {column: _column_fingerprint(data[column]) for column in data.columns}
+        return {
+            validation_type: (
+                len(data),
+                tuple(fingerprints.items()) if columns is None
+                else tuple(fingerprints.get(column) for column in columns)
+            )
+            for validation_type, columns in self._check_columns.items()
+        }
+
+    def _reuse_unchanged_results(self, signatures: Dict[str, Tuple]) -> None:
+        """Carry over results and violation masks of checks whose input columns are unchanged."""
+        validations = self.validation_results['validations']
+        for validation_type, signature in signatures.items():
+            previous = self._last_validations.get(validation_type)
+            if previous is None or previous['status'] not in ('completed', 'failed'):
+                continue
+            if self._last_signatures.get(validation_type) != signature:
+                continue
+            validations[validation_type] = previous
+            for position, key in enumerate(self._row_rules):
+                if key[0] == validation_type:
+                    self._violations[:, position] = self._last_violations[:, position]
+
+    def _record_violations(self, key: Tuple[str, str], mask: Any) -> None:
+        """Store a row rule's violation mask in its column of the violation matrix."""
+        self._violations[:, self._row_rule_index[key]] = mask
+
+    def get_violating_rows(self) -> Dict[Tuple[str, str], np.ndarray]:
+        """Return the positions of the rows each row-level rule flagged in the last validation run."""
+        return {
+            key: np.flatnonzero(self._violations[:, position])
+            for position, key in enumerate(self._row_rules)
+        }
+
+    def _with_arrow_strings(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Convert object columns holding only strings to Arrow-backed strings, if enabled and pyarrow is installed."""
+        if not self.arrow_strings or not _HAS_PYARROW:
+            return data
+
+        string_columns = [
+            column for column in data.select_dtypes(include='object').columns
+            if pd.api.types.infer_dtype(data[column], skipna=True) == 'string'
+        ]
+        if not string_columns:
+            return data
+
+        return data.astype({column: 'string[pyarrow]' for column in string_columns})
+
+    def _run_count_validation(self, dataset: pd.DataFrame) -> None:
         """Validate record count against expected value."""
         validation_type = 'count_validation'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            # Get expected count from configuration
-            expected_count = self.config.get('expected_count', 0)
+            # Expected count comes from configuration
+            expected_count = self._expected_count
             
             # Validate count
             actual_count = len(dataset)
@@ -68,19 +781,24 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_checksum_validation(self, dataset: PandasDataset) -> None:
+    def _run_checksum_validation(self, dataset: pd.DataFrame) -> None:
         """Validate checksum of specified columns."""
         validation_type = 'checksum_validation'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            checksum_columns = self.config.get('checksum_columns', [])
-            checksums = {}
-            
-            for column in checksum_columns:
-                if column in dataset.columns:
-                    checksums[column] = dataset[column].sum()
-            
+            columns = [column for column in self._checksum_columns if column in dataset.columns]
+
+            # One reduction per dtype block: summing mixed int and float columns together would
+            # upcast the integers to float64 and lose exact checksums; to_dict() yields native scalars
+            columns_by_dtype = {}
+            for column, dtype in dataset[columns].dtypes.items():
+                columns_by_dtype.setdefault(dtype, []).append(column)
+            sums = {}
+            for dtype_columns in columns_by_dtype.values():
+                sums.update(dataset[dtype_columns].sum(numeric_only=True).to_dict())
+            checksums = {column: sums[column] for column in columns if column in sums}
+
             self.validation_results['validations'][validation_type] = {
                 'status': 'completed',
                 'details': {'checksums': checksums}
@@ -90,22 +808,31 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_duplicate_check(self, dataset: PandasDataset) -> None:
+    def _run_duplicate_check(self, dataset: pd.DataFrame) -> None:
         """Check for duplicate records."""
         validation_type = 'duplicate_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
             # Get columns to check for duplicates
-            check_columns = self.config.get('duplicate_check_columns', dataset.columns.tolist())
-            
-            # Find duplicates
-            duplicates = dataset.duplicated(subset=check_columns, keep='first')
-            duplicate_count = duplicates.sum()
+            check_columns = self._duplicate_check_columns or dataset.columns.tolist()
             
+            # Reduce each row key to a single uint64 hash to find candidate rows cheaply. Hashes can
+            # collide (mixed-type object columns hash 1 and '1' alike), so only rows sharing a hash
+            # are compared exactly; every true duplicate is among them, in the original order.
+            row_hashes = pd.util.hash_pandas_object(dataset[check_columns], index=False)
+            candidates = np.flatnonzero(row_hashes.duplicated(keep=False).to_numpy())
+            duplicates = np.zeros(len(dataset), dtype=bool)
+            if len(candidates):
+                duplicates[candidates] = dataset[check_columns].iloc[candidates].duplicated(keep='first').to_numpy()
+            self._record_violations((validation_type, 'row'), duplicates)
+            duplicate_count = int(duplicates.sum())
+
             # Get sample of duplicate records
-            duplicate_samples = dataset[duplicates].head(5).to_dict('records')
-            
+            duplicate_samples = []
+            if duplicate_count > 0:
+                duplicate_samples = dataset.iloc[_sample_positions(duplicates)].to_dict('records')
+
             result = {
                 'status': 'completed' if duplicate_count == 0 else 'failed',
                 'details': {
@@ -121,26 +848,30 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_pattern_check(self, dataset: PandasDataset) -> None:
+    def _run_pattern_check(self, dataset: pd.DataFrame) -> None:
         """Check if values match specified patterns."""
         validation_type = 'pattern_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            pattern_rules = self.config.get('pattern', {})
             results = {}
             
-            for column, pattern in pattern_rules.items():
+            for column, pattern in self._compiled_patterns.items():
                 if column in dataset.columns:
-                    # Use Great Expectations to check pattern
-                    validation = dataset.expect_column_values_to_match_regex(
-                        column,
-                        pattern
-                    )
+                    values = dataset[column]
+                    database = None
+                    if len(values) >= _HYPERSCAN_MIN_ROWS:
+                        if column not in self._hyperscan_databases:
+                            self._hyperscan_databases[column] = _compile_hyperscan(pattern)
+                        database = self._hyperscan_databases[column]
+                    unexpected = _unmatched_mask(values, pattern, database)
+                    self._record_violations((validation_type, column), unexpected)
+                    success, unexpected_count, samples = _summarize_unexpected(values, unexpected)
                     results[column] = {
-                        'success': validation.success,
-                        'unexpected_count': validation.result['unexpected_count'],
-                        'unexpected_samples': validation.result['unexpected_list'][:5]
+                        'success': success,
+                        'unexpected_count': unexpected_count,
+                        'unexpected_samples': samples,
+                        'missing_count': int(values.isna().sum())
                     }
             
             self.validation_results['validations'][validation_type] = {
@@ -152,25 +883,27 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_enumeration_check(self, dataset: PandasDataset) -> None:
+    def _run_enumeration_check(self, dataset: pd.DataFrame) -> None:
         """Check if values are within allowed enumerations."""
         validation_type = 'enumeration_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            enum_rules = self.config.get('enumerations', {})
             results = {}
             
-            for column, allowed_values in enum_rules.items():
+            for column, allowed_values in self._enumerations.items():
                 if column in dataset.columns:
-                    validation = dataset.expect_column_values_to_be_in_set(
-                        column,
-                        allowed_values
-                    )
+                    values = dataset[column]
+                    # The polars engine may already have computed this mask
+                    unexpected = self._violation_masks.get((validation_type, column))
+                    if unexpected is None:
+                        unexpected = _outside_set_mask(values, allowed_values)
+                    self._record_violations((validation_type, column), unexpected)
+                    success, unexpected_count, samples = _summarize_unexpected(values, unexpected)
                     results[column] = {
-                        'success': validation.success,
-                        'unexpected_count': validation.result['unexpected_count'],
-                        'unexpected_samples': validation.result['unexpected_list'][:5]
+                        'success': success,
+                        'unexpected_count': unexpected_count,
+                        'unexpected_samples': samples
                     }
             
             self.validation_results['validations'][validation_type] = {
@@ -182,27 +915,27 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_mandatory_check(self, dataset: PandasDataset) -> None:
+    def _run_mandatory_check(self, dataset: pd.DataFrame) -> None:
         """Check for null values in mandatory fields."""
         validation_type = 'mandatory_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            mandatory_fields = [
-                field['column_name'] 
-                for field in self.config.get('template', []) 
-                if field.get('mandatory', False)
-            ]
-            
+            columns = [field for field in self._mandatory_fields if field in dataset.columns]
+
+            # Count nulls for all mandatory fields in one sweep over the column block
+            null_mask = dataset[columns].isna()
+            null_counts = null_mask.sum()
+
             results = {}
-            for field in mandatory_fields:
-                if field in dataset.columns:
-                    validation = dataset.expect_column_values_to_not_be_null(field)
-                    results[field] = {
-                        'success': validation.success,
-                        'null_count': validation.result['unexpected_count'],
-                        'null_examples': validation.result['unexpected_list'][:5]
-                    }
+            for field in columns:
+                self._record_violations((validation_type, field), null_mask[field])
+                null_count = int(null_counts[field])
+                results[field] = {
+                    'success': null_count == 0,
+                    'null_count': null_count,
+                    'null_examples': dataset[field].iloc[_sample_positions(null_mask[field])].tolist() if null_count else []
+                }
             
             self.validation_results['validations'][validation_type] = {
                 'status': 'completed' if all(r['success'] for r in results.values()) else 'failed',
@@ -213,34 +946,53 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_range_check(self, dataset: PandasDataset) -> None:
+    def _run_range_check(self, dataset: pd.DataFrame) -> None:
         """Check if numeric values are within specified ranges."""
         validation_type = 'range_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            range_rules = [
-                field for field in self.config.get('template', [])
-                if 'range' in field
+            rule_errors = [
+                f"{column}: {message}" for column, message in self._range_rule_errors.items()
+                if column in dataset.columns
             ]
-            
+            if rule_errors:
+                raise ValueError('; '.join(rule_errors))
+
+            columns = []
+            # Arrays for the generated tile function, in rule order; None where a rule is handled here
+            tiled_arrays = []
+            for column, bottom, top, inclusive in self._range_rules:
+                tiled_arrays.append(None)
+                if column not in dataset.columns:
+                    continue
+                columns.append(column)
+                # Each rule writes straight into its column of the violation matrix
+                out_of_range = self._violations[:, self._row_rule_index[(validation_type, column)]]
+                precomputed = self._violation_masks.get((validation_type, column))
+                if precomputed is not None:
+                    out_of_range[:] = precomputed
+                    continue
+                array = _range_array(dataset[column])
+                if _HAS_NUMBA and len(array) >= _NUMBA_MIN_ROWS and array.dtype.kind in 'iuf':
+                    out_of_range[:] = _range_kernel()(array, bottom, top, inclusive)
+                else:
+                    tiled_arrays[-1] = array
+
+            # Run every remaining rule on one row tile before moving on to the next
+            if any(array is not None for array in tiled_arrays):
+                for start in range(0, len(dataset), _RANGE_CHUNK_ROWS):
+                    self._mark_out_of_range(tiled_arrays, self._violations, slice(start, start + _RANGE_CHUNK_ROWS))
+
             results = {}
-            for rule in range_rules:
-                column = rule['column_name']
-                if column in dataset.columns:
-                    range_config = rule['range']
-                    validation = dataset.expect_column_values_to_be_between(
-                        column,
-                        min_value=range_config['bottom'],
-                        max_value=range_config['top'],
-                        include_min=range_config.get('scope') == 'inclusive',
-                        include_max=range_config.get('scope') == 'inclusive'
-                    )
-                    results[column] = {
-                        'success': validation.success,
-                        'unexpected_count': validation.result['unexpected_count'],
-                        'unexpected_samples': validation.result['unexpected_list'][:5]
-                    }
+            for column in columns:
+                values = dataset[column]
+                unexpected_rows = np.flatnonzero(self._violations[:, self._row_rule_index[(validation_type, column)]])
+                results[column] = {
+                    'success': len(unexpected_rows) == 0,
+                    'unexpected_count': len(unexpected_rows),
+                    'unexpected_samples': values.iloc[unexpected_rows[:5]].tolist()
+                }
             
             self.validation_results['validations'][validation_type] = {
                 'status': 'completed' if all(r['success'] for r in results.values()) else 'failed',
@@ -251,38 +1003,23 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_type_check(self, dataset: PandasDataset) -> None:
+    def _run_type_check(self, dataset: pd.DataFrame) -> None:
         """Check if columns have the correct data type."""
         validation_type = 'type_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            type_rules = [
-                field for field in self.config.get('template', [])
-                if 'type_name' in field
-            ]
-            
+            # Compare dtype objects directly rather than their string forms
+            actual_types = dataset.dtypes
             results = {}
-            for rule in type_rules:
-                column = rule['column_name']
+            for column, expected_type in self._expected_types.items():
                 if column in dataset.columns:
-                    expected_type = rule['type_name']
-                    # Map type names to pandas dtypes
-                    type_mapping = {
-                        'string': 'object',
-                        'integer': 'int64',
-                        'float': 'float64',
-                        'boolean': 'bool',
-                        'date': 'datetime64[ns]'
-                    }
-                    
-                    actual_type = str(dataset[column].dtype)
-                    expected_pandas_type = type_mapping.get(expected_type.lower(), expected_type)
-                    
+                    actual_type = actual_types[column]
+                    success = _matches_type(actual_type, expected_type)
                     results[column] = {
-                        'success': actual_type == expected_pandas_type,
-                        'expected_type': expected_pandas_type,
-                        'actual_type': actual_type
+                        'success': success,
+                        'expected_type': str(expected_type),
+                        'actual_type': str(actual_type)
                     }
             
             self.validation_results['validations'][validation_type] = {
@@ -294,27 +1031,36 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_unique_check(self, dataset: PandasDataset) -> None:
+    def _run_unique_check(self, dataset: pd.DataFrame) -> None:
         """Check if specified columns have unique values."""
         validation_type = 'unique_check'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            unique_fields = [
-                field['column_name'] 
-                for field in self.config.get('template', []) 
-                if field.get('unique', False)
-            ]
-            
+            columns = [field for field in self._unique_fields if field in dataset.columns]
+
+            # A column is unique when its distinct count equals its non-null count;
+            # only columns failing that test need a per-value duplicate scan
+            distinct_counts = dataset[columns].nunique()
+            non_null_counts = dataset[columns].count()
+
             results = {}
-            for field in unique_fields:
-                if field in dataset.columns:
-                    validation = dataset.expect_column_values_to_be_unique(field)
-                    results[field] = {
-                        'success': validation.success,
-                        'duplicate_count': validation.result['unexpected_count'],
-                        'duplicate_examples': validation.result['unexpected_list'][:5]
-                    }
+            for field in columns:
+                duplicate_examples = []
+                duplicate_count = 0
+                if distinct_counts[field] != non_null_counts[field]:
+                    # Hash-table pass over the column; keep positions rather than offending values
+                    values = dataset[field]
+                    duplicated = values.duplicated(keep=False).to_numpy() & values.notna().to_numpy()
+                    self._record_violations((validation_type, field), duplicated)
+                    duplicate_rows = np.flatnonzero(duplicated)
+                    duplicate_count = len(duplicate_rows)
+                    duplicate_examples = values.iloc[duplicate_rows[:5]].tolist()
+                results[field] = {
+                    'success': duplicate_count == 0,
+                    'duplicate_count': duplicate_count,
+                    'duplicate_examples': duplicate_examples
+                }
             
             self.validation_results['validations'][validation_type] = {
                 'status': 'completed' if all(r['success'] for r in results.values()) else 'failed',
@@ -325,35 +1071,41 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
-    def _run_business_rules(self, dataset: PandasDataset) -> None:
+    def _run_business_rules(self, dataset: pd.DataFrame) -> None:
         """Run custom business rule validations."""
         validation_type = 'business_rules'
         self.logger.info(f"Running {validation_type}")
         
         try:
-            business_rules = self.config.get('business_rules', [])
             results = {}
-            
-            for rule in business_rules:
-                rule_id = rule['rule_id']
-                # Create a query string for the business rule
-                query = f"({rule['condition']}) & ({rule['validation']})"
-                
-                # Apply the rule and get violations
-                try:
-                    mask = dataset.query(query)
-                    violations = dataset[~mask]
-                    
+
+            for rule_id, violated in self._evaluate_business_rules(dataset).items():
+                if isinstance(violated, Exception):
                     results[rule_id] = {
-                        'success': len(violations) == 0,
-                        'violation_count': len(violations),
-                        'violation_samples': violations.head(5).to_dict('records')
+                        'success': False,
+                        'error': str(violated)
                     }
-                except Exception as rule_error:
+                    continue
+
+                try:
+                    # Nulls left in a nullable boolean mask count as no violation
+                    violated = pd.array(violated).to_numpy(dtype=bool, na_value=False)
+                except Exception as mask_error:
                     results[rule_id] = {
                         'success': False,
-                        'error': str(rule_error)
+                        'error': str(mask_error)
                     }
+                    continue
+
+                self._record_violations((validation_type, rule_id), violated)
+                violation_count = int(violated.sum())
+                results[rule_id] = {
+                    'success': violation_count == 0,
+                    'violation_count': violation_count,
+                    'violation_samples': (
+                        dataset.iloc[_sample_positions(violated)].to_dict('records') if violation_count else []
+                    )
+                }
             
             self.validation_results['validations'][validation_type] = {
                 'status': 'completed' if all(r['success'] for r in results.values()) else 'failed',
@@ -364,6 +1116,48 @@ class DataValidator:
             self.logger.error(f"Error in {validation_type}: {str(e)}")
             self._log_validation_error(validation_type, str(e))
 
+    def _evaluate_business_rules(self, dataset: pd.DataFrame) -> Dict[str, Any]:
+        """Evaluate every business rule to a violation mask, or to the exception that rule raised."""
+        if not self._business_rule_expressions:
+            return {}
+
+        polars_masks = {
+            rule_id: self._violation_masks[('business_rules', rule_id)]
+            for rule_id in self._business_rule_expressions
+            if ('business_rules', rule_id) in self._violation_masks
+        }
+        if len(polars_masks) == len(self._business_rule_expressions):
+            return polars_masks
+
+        # numexpr fuses each rule's arithmetic and comparisons into one threaded kernel;
+        # the python engine evaluates the same expressions with NumPy operations
+        columns = {
+            name: _eval_operand(dataset[name]) for name in self._business_rule_names if name in dataset.columns
+        }
+        # numexpr can't take the extension columns _eval_operand leaves in place, so pick the
+        # python engine for them up front instead of letting pandas switch with a warning
+        engine = (
+            'python' if any(isinstance(values.dtype, pd.api.extensions.ExtensionDtype) for values in columns.values())
+            else _EVAL_ENGINE
+        )
+        try:
+            masks = pd.eval(self._business_rule_program, engine=engine, resolvers=(columns,), target={})
+            return {
+                rule_id: masks[f"_rule_{position}"]
+                for position, rule_id in enumerate(self._business_rule_expressions)
+            }
+        except Exception:
+            pass
+
+        # Something in the batch failed; evaluate rule by rule so one bad rule doesn't hide the rest
+        violations = {}
+        for rule_id, expression in self._business_rule_expressions.items():
+            try:
+                violations[rule_id] = pd.eval(expression, engine=engine, resolvers=(columns,))
+            except Exception as rule_error:
+                violations[rule_id] = rule_error
+        return violations
+
     def _log_validation_error(self, validation_type: str, error_message: str) -> None:
         """Log validation error and update validation results."""
         self.validation_results['validations'][validation_type] = {
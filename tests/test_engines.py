@@ -0,0 +1,59 @@
+import json
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dq_framework.validations import DataValidator, _HAS_POLARS
+
+
+def _validate(config, data, engine):
+    return DataValidator(config, engine=engine).validate_dataset(data, 'parity')['validations']
+
+
+@unittest.skipUnless(_HAS_POLARS, "polars is not installed")
+class PolarsEngineParityTest(unittest.TestCase):
+    """The polars engine must report the same violations as the default pandas engine."""
+
+    def assert_engines_agree(self, config, data):
+        expected = _validate(config, data, 'pandas')
+        actual = _validate(config, data, 'polars')
+        self.assertEqual(json.dumps(actual, default=str), json.dumps(expected, default=str))
+        return expected
+
+    def test_boolean_operators_bind_looser_than_comparisons(self):
+        config = {'business_rules': [{'rule_id': 'BR1', 'expression': 'a > 2 & b < 3'}]}
+        data = pd.DataFrame({'a': [1, 5, 5, 1], 'b': [1, 1, 5, 5]})
+        results = self.assert_engines_agree(config, data)
+        self.assertEqual(results['business_rules']['details']['BR1']['violation_count'], 3)
+
+    def test_nan_comparisons_are_false_before_negation(self):
+        config = {'business_rules': [
+            {'rule_id': 'BR1', 'condition': 'age > 100', 'validation': 'fage < 150'},
+            {'rule_id': 'BR2', 'expression': 'fage < 150'},
+        ]}
+        data = pd.DataFrame({'age': [120, 120, 50, 130], 'fage': [np.nan, 100.0, np.nan, 200.0]})
+        results = self.assert_engines_agree(config, data)
+        self.assertEqual(results['business_rules']['details']['BR1']['violation_count'], 2)
+        self.assertEqual(results['business_rules']['details']['BR2']['violation_count'], 3)
+
+    def test_nullable_and_arrow_nulls_behave_like_nan(self):
+        config = {'business_rules': [{'rule_id': 'BR1', 'expression': 'a + b >= c'}]}
+        for dtype in ('Int64', 'int64[pyarrow]'):
+            with self.subTest(dtype=dtype):
+                data = pd.DataFrame({'a': [1, None, 5], 'b': [1, 1, 1], 'c': [1, 1, 9]}, dtype=dtype)
+                results = self.assert_engines_agree(config, data)
+                self.assertEqual(results['business_rules']['status'], 'failed')
+                self.assertEqual(results['business_rules']['details']['BR1']['violation_count'], 2)
+
+    def test_rules_that_do_not_fit_the_data_do_not_abort_the_run(self):
+        config = {
+            'template': [{'column_name': 'name', 'range': {'bottom': 0, 'top': 10}}],
+            'enumerations': {'code': ['1', '2']},
+        }
+        data = pd.DataFrame({'name': ['a', 'b', 'c'], 'code': [1, 2, 3]})
+        self.assert_engines_agree(config, data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import re
+import unittest
+
+import pandas as pd
+
+from dq_framework.validations import DataValidator, _HAS_HYPERSCAN, _compile_hyperscan, _unmatched_mask
+
+
+def _validate(config, data, **options):
+    return DataValidator(config, **options).validate_dataset(data, 'test')['validations']
+
+
+class ChecksumValidationTest(unittest.TestCase):
+    def test_integer_checksums_stay_exact_next_to_float_columns(self):
+        data = pd.DataFrame({'big': [2 ** 53 + 1, 2], 'ratio': [0.5, 1.0]})
+        results = _validate({'checksum_columns': ['big', 'ratio']}, data)
+        checksums = results['checksum_validation']['details']['checksums']
+        self.assertEqual(checksums, {'big': 2 ** 53 + 3, 'ratio': 1.5})
+        self.assertIsInstance(checksums['big'], int)
+
+
+class DuplicateCheckTest(unittest.TestCase):
+    def test_mixed_type_values_are_not_duplicates_of_their_string_form(self):
+        data = pd.DataFrame({'k': [1, '1', 2.0, '2.0']})
+        results = _validate({}, data)
+        self.assertEqual(results['duplicate_check']['details']['duplicate_count'], int(data.duplicated().sum()))
+        self.assertEqual(results['duplicate_check']['status'], 'completed')
+
+    def test_duplicates_match_dataframe_duplicated(self):
+        data = pd.DataFrame({'k': ['a', 'b', 'a', 'c', 'b'], 'n': [1, 2, 1, 3, 5]})
+        results = _validate({}, data)
+        details = results['duplicate_check']['details']
+        self.assertEqual(details['duplicate_count'], 1)
+        self.assertEqual(details['duplicate_samples'], [{'k': 'a', 'n': 1}])
+
+
+class PatternCheckTest(unittest.TestCase):
+    def test_arrow_strings_match_like_python_re(self):
+        values = ['ünï@ex.com', '١٢٣', 'abc\n', 'a b', 'ab', None]
+        for source in (r'^\w+@\w+\.com$', r'^\d+$', r'^a\sb$', r'(?i)^AB$', r'^[a-z]+$', r'^(?=a)ab$'):
+            pattern = re.compile(source)
+            with self.subTest(pattern=source):
+                self.assertEqual(
+                    _unmatched_mask(pd.Series(values, dtype='string[pyarrow]'), pattern).tolist(),
+                    _unmatched_mask(pd.Series(values, dtype=object), pattern).tolist(),
+                )
+
+
+class SkipUnchangedTest(unittest.TestCase):
+    def test_values_that_only_differ_in_type_are_revalidated(self):
+        config = {'enumerations': {'c': ['1', 'a']}}
+        validator = DataValidator(config, skip_unchanged=True)
+        validator.validate_dataset(pd.DataFrame({'c': ['1', 'a']}), 'test')
+        data = pd.DataFrame({'c': [1, 'a']})
+        rerun = validator.validate_dataset(data, 'test')['validations']
+        self.assertEqual(rerun['enumeration_check'], _validate(config, data)['enumeration_check'])
+        self.assertEqual(rerun['enumeration_check']['status'], 'failed')
+
+
+@unittest.skipUnless(_HAS_HYPERSCAN, "hyperscan is not installed")
+class HyperscanPatternTest(unittest.TestCase):
+    """Hyperscan must flag exactly the rows Python ``re`` flags."""
+
+    def setUp(self):
+        values = ['x'] * 100_000
+        values[10], values[11], values[20], values[30] = 'a', 'b', 'q@b', None
+        self.values = pd.Series(values, dtype=object)
+
+    def test_matches_do_not_cross_row_boundaries(self):
+        data = pd.DataFrame({'c': self.values.fillna('x')})
+        results = _validate({'pattern': {'c': r'^a[^@]*b$'}}, data)
+        self.assertEqual(results['pattern_check']['details']['c']['unexpected_count'], 100_000)
+
+    def test_hyperscan_agrees_with_re(self):
+        for source in (r'^a[^@]*b$', r'^[^@]*b$', r'^\s*x$', r'^(?:a|x)$'):
+            pattern = re.compile(source)
+            database = _compile_hyperscan(pattern)
+            self.assertIsNotNone(database)
+            self.assertEqual(
+                _unmatched_mask(self.values, pattern, database).tolist(),
+                _unmatched_mask(self.values, pattern, None).tolist(),
+                source,
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()